@@ -33,8 +33,8 @@ class OneDimensionalTensorNetwork:
     A one-dimensional tensor network. MatrixProductState and
     MatrixProductOperator are subclasses of this class. 
 
-    An instance of `OneDimensionalTensorNetwork` contains a one-dimensional
-    array of tensors in its `data` attribute. This one dimensional array is
+    An instance of `OneDimensionalTensorNetwork` contains a list of tensors
+    in its `data` attribute. This one dimensional array is
     specified in the `tensors` argument when initialising the array. Each
     tensor in `data` requires a left index and a right index. The right index
     is taken to be contracted with the left index of the next tensor in the
@@ -50,8 +50,9 @@ class OneDimensionalTensorNetwork:
     def __init__(self, tensors, left_label="left", right_label="right"):
         self.left_label = left_label
         self.right_label = right_label
-        # Copy input tensors to the data attribute
-        self.data = np.array([x.copy() for x in tensors])
+        # Copy input tensors to the data attribute. A plain list is used so
+        # that item access does not go through numpy object arrays.
+        self.data = [x.copy() for x in tensors]
         # Every tensor will have three indices corresponding to "left", "right"
         # and "phys" labels. If only two are specified for left and right
         # boundary tensors (for open boundary conditions) an extra dummy index
@@ -78,11 +79,12 @@ class OneDimensionalTensorNetwork:
         """Alternative the standard copy method, returning a
         OneDimensionalTensorNetwork that is not
         linked in memory to the previous ones."""
-        return OneDimensionalTensorNetwork([x.copy() for x in self],
-                                           self.left_label, self.right_label)
+        # The tensors are copied on initialisation
+        return OneDimensionalTensorNetwork(self.data, self.left_label,
+                                           self.right_label)
 
     def reverse(self):
-        self.data = self.data[::-1]
+        self.data = list(reversed(self.data))
         temp = self.left_label
         self.left_label = self.right_label
         self.right_label = temp
@@ -90,7 +92,9 @@ class OneDimensionalTensorNetwork:
     def complex_conjugate(self):
         """Will complex conjugate every entry of every tensor in array."""
         for x in self.data:
-            x.conjugate()
+            # Real tensors are their own complex conjugate
+            if np.iscomplexobj(x.data):
+                x.conjugate()
 
     def swap_gate(self, i, threshold=1e-15):
         """
@@ -135,8 +139,7 @@ class OneDimensionalTensorNetwork:
         if not isinstance(new_labels, list):
             new_labels = [new_labels]
 
-        for x in self.data:
-            x.replace_label(old_labels, new_labels)
+        _replace_tensor_labels(self.data, old_labels, new_labels)
 
         if self.left_label in old_labels:
             self.left_label = new_labels[old_labels.index(self.left_label)]
@@ -197,6 +200,29 @@ class MatrixProductState(OneDimensionalTensorNetwork):
         OneDimensionalTensorNetwork.__init__(self, tensors,
                                              left_label=left_label, right_label=right_label)
         self.phys_label = phys_label
+        self._order_indices()
+
+    def _order_indices(self):
+        """Order the indices of every tensor as physical, left, right, the
+        order in which `left_canonise` reads them. Only the labels and strides
+        change, the data is not copied."""
+        labels = [self.phys_label, self.left_label, self.right_label]
+        for x in self.data:
+            if x.labels == labels:
+                continue
+            if len(x.labels) == 3 and set(x.labels) == set(labels):
+                x.data = _site_data(x, labels)
+                x.labels = list(labels)
+            elif self.phys_label in x.labels:
+                x.move_index(self.phys_label, 0)
+                if self.left_label in x.labels:
+                    x.move_index(self.left_label, 1)
+
+    def reverse(self):
+        OneDimensionalTensorNetwork.reverse(self)
+        # Reversing swaps the left and right labels, so reorder the indices
+        # to keep them in physical, left, right order
+        self._order_indices()
 
     def __repr__(self):
         return ("MatrixProductState(tensors=%r, left_label=%r, right_label=%r,"
@@ -212,7 +238,8 @@ class MatrixProductState(OneDimensionalTensorNetwork):
 
     def copy(self):
         """Return an MPS that is not linked in memory to the original."""
-        return MatrixProductState([x.copy() for x in self], self.left_label,
+        # The tensors are copied on initialisation
+        return MatrixProductState(self.data, self.left_label,
                                   self.right_label, self.phys_label)
 
     def left_canonise(self, start=0, end=-1, chi=None, threshold=1e-14,
@@ -258,104 +285,102 @@ class MatrixProductState(OneDimensionalTensorNetwork):
             True specifies that a QR decomposition is performed rather than an
             SVD (which may improve performance). No truncation of singular
             values is possible with a QR decomposition, thus `chi` and
-            `threshold` arguments are ignored.
+            `threshold` arguments are ignored. A QR decomposition is also used
+            whenever no truncation is requested (`chi` is None or 0 and
+            `threshold` <= 0).
         """
         N = len(self)
         if end == -1:
             end = N
+        if start >= end:
+            return
+        labels = [self.phys_label, self.left_label, self.right_label]
+        # numpy, or cupy if the tensors are held on the GPU
+        xp = tsr._array_module(self[start].data)
 
-        if qr_decomposition:
+        # Without truncation the singular values are never needed, so the
+        # cheaper QR decomposition gives the same left-canonical form
+        if qr_decomposition or (not chi and threshold <= 0):
             for i in range(start, end):
                 if i == N - 1:
                     # The final QR has no right index, so R are just
                     # scalars. R is the norm of the state.
-                    norm = np.linalg.norm(self[i].data)
+                    norm = xp.linalg.norm(self[i].data)
                     #If the norm of the state is zero, convert self a zero product state.
                     if norm==0.0:
                         for k in range(N):
-                            self[k].data=np.zeros((self[k].index_dimension(self.phys_label), 1,1))
+                            self[k].data=xp.zeros((self[k].index_dimension(self.phys_label), 1,1))
                             self[k].labels=[self.phys_label, self.left_label, self.right_label]
                         return
                     if normalise == True and start == 0:  # Whole chain is canonised
                         self[i].data = self[i].data / norm
                     return
                 else:
-                    qr_label = unique_label()
-                    Q, R = tsr.tensor_qr(self[i], [self.phys_label,
-                                                   self.left_label], qr_label=qr_label)
+                    # Reshape into a matrix with the physical and left indices
+                    # as rows
+                    A = _site_data(self[i], labels)
+                    q, r = tsr._qr(xp.reshape(A, (-1, A.shape[2])))
 
                 # Replace tensor at site i with Q
-                Q.replace_label(qr_label + "in", self.right_label)
-                self[i] = Q
+                self[i] = tsr.Tensor(xp.reshape(q, A.shape[:2] + (q.shape[1],)),
+                                     labels)
 
-                # Absorb R into next tensor
-                self[i + 1] = tsr.contract(R, self[i + 1], self.right_label,
-                                           self.left_label)
-                self[i + 1].replace_label(qr_label + "out", self.left_label)
+                # Absorb R into next tensor, keeping the physical, left, right
+                # index order
+                self[i + 1] = tsr.Tensor(
+                    xp.matmul(r, _site_data(self[i + 1], labels)), labels)
 
         else:
-            # At each step will divide by a constant so that the largest singular
-            # value of S is 1. Will store the product of these constants in `norm`
-            norm = 1
             for i in range(start, end):
                 if i == N - 1:
                     # The final SVD has no right index, so S and V are just scalars.
                     # S is the norm of the state.
+                    norm = xp.linalg.norm(self[i].data)
                     #If the norm of the state is zero, convert self a zero product state.
-                    if np.linalg.norm(self[i].data)==0.0:
+                    if norm==0.0:
                         for k in range(N):
-                            self[k].data=np.zeros((self[k].index_dimension(self.phys_label), 1,1))
+                            self[k].data=xp.zeros((self[k].index_dimension(self.phys_label), 1,1))
                             self[k].labels=[self.phys_label, self.left_label, self.right_label]
                         return
                     if normalise == True and start == 0:  # Whole chain is canonised
-                        self[i].data = self[i].data / np.linalg.norm(self[i].data)
-                    else:
-                        self[i].data = self[i].data * norm
+                        self[i].data = self[i].data / norm
                     return
                 else:
-                    svd_label = unique_label()
-                    U, S, V = tsr.tensor_svd(self[i], [self.phys_label,
-                                                       self.left_label], svd_label=svd_label)
+                    # Reshape into a matrix with the physical and left indices
+                    # as rows
+                    A = _site_data(self[i], labels)
+                    u, singular_values, v = tsr._svd(xp.reshape(A,
+                                                     (-1, A.shape[2])))
 
                 # Truncate to threshold and to specified chi
-                singular_values = np.diag(S.data)
                 largest_singular_value = singular_values[0]
                 if largest_singular_value==0.0:
                     #Return an MPS of same size but all entries zero
                     #And virtual bond dimension 1
                     #i.e. a product state of zeros
                     for k in range(N):
-                        self[k].data=np.zeros((self[k].index_dimension(self.phys_label), 1,1))
+                        self[k].data=xp.zeros((self[k].index_dimension(self.phys_label), 1,1))
                         self[k].labels=[self.phys_label, self.left_label, self.right_label]
                     return
 
-                # Normalise S
-                singular_values = singular_values / largest_singular_value
-                norm *= largest_singular_value
-
-                singular_values_to_keep = singular_values[singular_values >
-                                                          threshold]
+                # Singular values are sorted in descending order, so those
+                # above threshold (relative to the largest singular value) are
+                # the first n_keep
+                n_keep = int(xp.searchsorted(-singular_values,
+                                             -threshold * largest_singular_value))
                 if chi:
-                    singular_values_to_keep = singular_values_to_keep[:chi]
-                S.data = np.diag(singular_values_to_keep)
-                # Truncate corresponding singular index of U and V
-                U.data = U.data[:, :, 0:len(singular_values_to_keep)]
-                V.data = V.data[0:len(singular_values_to_keep)]
-
-                U.replace_label(svd_label + "in", self.right_label)
-                self[i] = U
-                self[i + 1] = tsr.contract(V, self[i + 1], self.right_label,
-                                           self.left_label)
-                self[i + 1] = tsr.contract(S, self[i + 1], [svd_label + "in"],
-                                           [svd_label + "out"])
-                self[i + 1].replace_label(svd_label + "out", self.left_label)
-
-                # Reabsorb normalisation factors into next tensor
-                # Note if i==N-1 (end of chain), this will not be reached
-                # and normalisation factors will be taken care of in the earlier
-                # block.
-                if i == end - 1:
-                    self[i + 1].data *= norm
+                    n_keep = min(n_keep, chi)
+
+                # Truncate corresponding singular index of U and V, and absorb
+                # the singular values into V by scaling its rows
+                self[i] = tsr.Tensor(xp.reshape(u[:, :n_keep],
+                                                A.shape[:2] + (n_keep,)), labels)
+                V = singular_values[:n_keep, None] * v[:n_keep]
+
+                # Absorb V into next tensor, keeping the physical, left, right
+                # index order
+                self[i + 1] = tsr.Tensor(
+                    xp.matmul(V, _site_data(self[i + 1], labels)), labels)
 
     def right_canonise(self, start=0, end=-1, chi=None, threshold=1e-14,
                        normalise=False, qr_decomposition=False):
@@ -387,8 +412,7 @@ class MatrixProductState(OneDimensionalTensorNetwork):
         if not isinstance(new_labels, list):
             new_labels = [new_labels]
 
-        for x in self.data:
-            x.replace_label(old_labels, new_labels)
+        _replace_tensor_labels(self.data, old_labels, new_labels)
 
         if self.left_label in old_labels:
             self.left_label = new_labels[old_labels.index(self.left_label)]
@@ -412,23 +436,29 @@ class MatrixProductState(OneDimensionalTensorNetwork):
         from right) that is not right canonised. If print_output=True, will 
         print useful information concerning whether a given MPS is in a 
         canonical form (left, right, mixed)."""
-        mps_cc = mps_complex_conjugate(self)
+        # Contract a tensor with its conjugate over the given axes of its
+        # (physical, left, right) ordered data. Tensors are conjugated one at
+        # a time (and only if complex), since the checks below may stop at
+        # the first site.
+        labels = [self.phys_label, self.left_label, self.right_label]
+
+        def overlap_matrix(i, axes):
+            A = _site_data(self[i], labels)
+            Ac = np.conjugate(A) if np.iscomplexobj(A) else A
+            return np.tensordot(A, Ac, (axes, axes))
+
         first_site_not_left_canonised = len(self) - 1
         for i in range(len(self) - 1):
-            I = tsr.contract(self[i], mps_cc[i],
-                             [self.phys_label, self.left_label],
-                             [mps_cc.phys_label, mps_cc.left_label])
+            I = overlap_matrix(i, [0, 1])
             # Check if tensor is left canonised.
-            if np.linalg.norm(I.data - np.identity(I.data.shape[0])) > threshold:
+            if _subtract_identity_and_norm(I) > threshold:
                 first_site_not_left_canonised = i
                 break
         first_site_not_right_canonised = 0
         for i in range(len(self) - 1, 0, -1):
-            I = tsr.contract(self[i], mps_cc[i],
-                             [self.phys_label, self.right_label],
-                             [mps_cc.phys_label, mps_cc.right_label])
+            I = overlap_matrix(i, [0, 2])
             # Check if tensor is right canonised.
-            if np.linalg.norm(I.data - np.identity(I.data.shape[0])) > threshold:
+            if _subtract_identity_and_norm(I) > threshold:
                 first_site_not_right_canonised = i
                 break
         if print_output:
@@ -548,60 +578,55 @@ class MatrixProductState(OneDimensionalTensorNetwork):
             re_label = unique_label()
             lq_label = unique_label()
 
+            mps1_labels = [mps1.phys_label, mps1.left_label, mps1.right_label]
+            mps2_labels = [mps2.phys_label, mps2.left_label, mps2.right_label]
+            left_label, right_label = mps1.left_label, mps1.right_label
+            le_labels = [le_label + "1", le_label + "2"]
+            re_labels = [re_label + "1", re_label + "2"]
             right_environments = []
-            norms = [mps1[-1].norm()]
+            norms = [float(mps1[-1].norm())]
+            # Right environment of the last site is trivial
+            right_environment = tsr._array_module(mps2[-1].data).ones((1, 1))
             for i in range(mps2.nsites - 1, 0, -1):
 
                 # Optimise the tensor at site i by contracting with left and
                 # right environments
-                updated_tensor = tsr.contract(mps2[i], left_environments[i - 1],
-                                              mps2.left_label, le_label + "2")
-                if i != mps2.nsites - 1:
-                    updated_tensor = tsr.contract(updated_tensor,
-                                                  right_environment, mps2.right_label, re_label + "2")
-                    updated_tensor.replace_label(re_label + "1",
-                                                 mps1.right_label)
-                updated_tensor.replace_label([le_label + "1", mps2.phys_label]
-                                             , [mps1.left_label, mps1.phys_label])
+                left_environment = left_environments[i - 1]
+                left_environment = np.transpose(left_environment.data,
+                                                [left_environment.labels.index(le_labels[0]),
+                                                 left_environment.labels.index(le_labels[1])])
+                # The target tensor with the right environment applied is
+                # reused for the next right environment
+                mps2_site = np.matmul(_site_data(mps2[i], mps2_labels),
+                                      right_environment.T)
+                updated_tensor = tsr.Tensor(np.matmul(left_environment,
+                                                      mps2_site), mps1_labels)
 
                 # Right canonise the tensor at site i using LQ decomposition
                 # Absorb L into tensor at site i-1
-                L, Q = tsr.tensor_lq(updated_tensor, mps1.left_label,
+                L, Q = tsr.tensor_lq(updated_tensor, left_label,
                                      lq_label=lq_label)
-                Q.replace_label(lq_label + "out", mps1.left_label)
-                L.replace_label(lq_label + "in", mps1.right_label)
+                Q.replace_label(lq_label + "out", left_label)
+                L.replace_label(lq_label + "in", right_label)
                 mps1[i] = Q
-                mps1[i - 1] = tsr.contract(mps1[i - 1], L, mps1.right_label,
-                                           mps1.left_label)
+                mps1[i - 1] = tsr.contract(mps1[i - 1], L, right_label,
+                                           left_label)
 
                 # Compute norm of mps
                 # Taking advantage of canonical form
-                norms.append(mps1[i - 1].norm())
+                norms.append(float(mps1[i - 1].norm()))
 
                 # Compute next column of right_environment
-                if i == mps2.nsites - 1:
-                    right_environment = tsr.contract(tsr.conjugate(mps1[i]),
-                                                     mps2[i], mps1.phys_label, self.phys_label)
-                    right_environment.remove_all_dummy_indices(
-                        labels=[mps1.right_label, mps2.right_label])
-                else:
-                    right_environment.contract(tsr.conjugate(mps1[i]),
-                                               re_label + "1", mps1.right_label)
-                    right_environment.contract(mps2[i], [mps1.phys_label,
-                                                         re_label + "2"], [self.phys_label, self.right_label])
-
-                right_environment.replace_label([mps1.left_label,
-                                                 mps2.left_label], [re_label + "1", re_label + "2"])
-                right_environments.append(right_environment.copy())
+                right_environment = np.tensordot(
+                    np.conjugate(_site_data(mps1[i], mps1_labels)), mps2_site,
+                    ([0, 2], [0, 2]))
+                right_environments.append(tsr.Tensor(right_environment,
+                                                     re_labels))
 
                 # At second last site, compute final tensor
                 if i == 1:
-                    updated_tensor = tsr.contract(mps2[0], right_environment,
-                                                  mps2.right_label, re_label + "2")
-                    updated_tensor.replace_label([mps2.phys_label,
-                                                  re_label + "1"],
-                                                 [mps1.phys_label, mps1.right_label])
-                    mps1[0] = updated_tensor
+                    mps1[0] = tsr.Tensor(np.matmul(_site_data(mps2[0], mps2_labels),
+                                                   right_environment.T), mps1_labels)
 
             return right_environments, np.array(norms)
 
@@ -924,7 +949,8 @@ class MatrixProductStateCanonical(OneDimensionalTensorNetwork):
 
     def copy(self):
         """Return an MPS that is not linked in memory to the original."""
-        return MatrixProductStateCanonical([x.copy() for x in self],
+        # The tensors are copied on initialisation
+        return MatrixProductStateCanonical(self.data,
                                            self.left_label, self.right_label, self.phys_label)
 
     def replace_labels(self, old_labels, new_labels):
@@ -937,8 +963,7 @@ class MatrixProductStateCanonical(OneDimensionalTensorNetwork):
         if not isinstance(new_labels, list):
             new_labels = [new_labels]
 
-        for x in self.data:
-            x.replace_label(old_labels, new_labels)
+        _replace_tensor_labels(self.data, old_labels, new_labels)
 
         if self.left_label in old_labels:
             self.left_label = new_labels[old_labels.index(self.left_label)]
@@ -1020,14 +1045,17 @@ class MatrixProductStateCanonical(OneDimensionalTensorNetwork):
         for i in range(self.nsites_physical):
             A = (self[self.physical_site(i) - 1][self.right_label,]
                  * self[self.physical_site(i)][self.left_label,])
-            Ad = tsr.conjugate(A)
+            Ad = tsr.conjugate(A) if np.iscomplexobj(A.data) else A
             I = tsr.contract(A, Ad,
                              [self.phys_label, self.left_label],
                              [self.phys_label, self.left_label])
-            # Check if tensor is left canonised.
-            if np.linalg.norm(I.data - np.identity(I.data.shape[0])) > threshold:
-                if i == 0 or i == self.nsites_physical - 1:
-                    If = I.data.flatten()
+            # Check if tensor is left canonised. The check overwrites I.data,
+            # so keep a flattened copy for the boundary sites.
+            boundary_site = i == 0 or i == self.nsites_physical - 1
+            if boundary_site:
+                If = I.data.flatten()
+            if _subtract_identity_and_norm(I.data) > threshold:
+                if boundary_site:
                     if len(If[np.abs(If) > threshold]) > 1:
                         not_left_canonised.append(i)
                     else:
@@ -1037,14 +1065,17 @@ class MatrixProductStateCanonical(OneDimensionalTensorNetwork):
         for i in range(self.nsites_physical):
             B = (self[self.physical_site(i)][self.right_label,]
                  * self[self.physical_site(i) + 1][self.left_label,])
-            Bd = tsr.conjugate(B)
+            Bd = tsr.conjugate(B) if np.iscomplexobj(B.data) else B
             I = tsr.contract(B, Bd,
                              [self.phys_label, self.right_label],
                              [self.phys_label, self.right_label])
-            # Check if tensor is right canonised.
-            if np.linalg.norm(I.data - np.identity(I.data.shape[0])) > threshold:
-                if i == 0 or i == self.nsites_physical - 1:
-                    If = I.data.flatten()
+            # Check if tensor is right canonised. The check overwrites I.data,
+            # so keep a flattened copy for the boundary sites.
+            boundary_site = i == 0 or i == self.nsites_physical - 1
+            if boundary_site:
+                If = I.data.flatten()
+            if _subtract_identity_and_norm(I.data) > threshold:
+                if boundary_site:
                     if len(If[np.abs(If) > threshold]) > 1:
                         not_right_canonised.append(i)
                     else:
@@ -1078,10 +1109,8 @@ class MatrixProductStateCanonical(OneDimensionalTensorNetwork):
         t = contract_virtual_indices(self, start, end + 1,
                                      periodic_boundaries=False)
         # Remember singular values
-        S1_inv = self[start].copy()
-        S1_inv.inv()
-        S2_inv = self[end].copy()
-        S2_inv.inv()
+        S1_inv = _inverse_singular_values(self[start])
+        S2_inv = _inverse_singular_values(self[end])
         # SVD and compress
         U, S, V = tsr.truncated_svd(t, [self.phys_label, self.left_label],
                                     chi=chi, threshold=threshold, absorb_singular_values=None)
@@ -1161,10 +1190,8 @@ class MatrixProductStateCanonical(OneDimensionalTensorNetwork):
         t = tsr.contract(t, gate, self.phys_label, gate_inputs)
 
         # split big tensor into MPS form by exact SVD
-        S1_inv = self[start].copy()
-        S1_inv.inv()
-        S2_inv = self[end].copy()
-        S2_inv.inv()
+        S1_inv = _inverse_singular_values(self[start])
+        S2_inv = _inverse_singular_values(self[end])
         if nsites == 1:
             t.replace_label([gate_outputs[0]], [self.phys_label])
             t = S1_inv[self.right_label,] * t[self.left_label,]
@@ -1214,10 +1241,8 @@ class MatrixProductStateCanonical(OneDimensionalTensorNetwork):
                                      periodic_boundaries=False)
 
         # remember inverse singular values
-        S1_inv = self[start].copy()
-        S1_inv.inv()
-        S2_inv = self[end].copy()
-        S2_inv.inv()
+        S1_inv = _inverse_singular_values(self[start])
+        S2_inv = _inverse_singular_values(self[end])
 
         U, S, V = tsr.truncated_svd(t, [self.left_label, self.phys_label],
                                     chi=chi, threshold=threshold, absorb_singular_values=None)
@@ -1367,6 +1392,45 @@ class MatrixProductOperator(OneDimensionalTensorNetwork):
         return self.data[site].index_dimension(self.physin_label)
 
 
+def _inverse_singular_values(S):
+    """Return the inverse of `S`, a Tensor whose data is a diagonal matrix of
+    singular values. Only the diagonal is inverted, which is much cheaper than
+    the general matrix inversion of `Tensor.inv`. As with `Tensor.inv`, a
+    `LinAlgError` is raised if `S` is singular."""
+    singular_values = np.diag(S.data)
+    if not np.all(singular_values):
+        raise np.linalg.LinAlgError("Singular matrix")
+    return tsr.Tensor(np.diag(1. / singular_values), S.labels)
+
+
+def _subtract_identity_and_norm(matrix):
+    """Subtract the identity from the square 2D array `matrix` in place and
+    return the Frobenius norm of the result, i.e. the distance of the original
+    `matrix` from the identity. Working in place avoids allocating an identity
+    matrix, so `matrix` should be a temporary array."""
+    matrix.flat[::matrix.shape[0] + 1] -= 1
+    return np.linalg.norm(matrix)
+
+
+def _replace_tensor_labels(tensors, old_labels, new_labels):
+    """Replace labels in `old_labels` by the respective labels in `new_labels`
+    on every tensor in `tensors`. The mapping is built once, and if a label
+    appears more than once in `old_labels` its first replacement is used, as
+    in `Tensor.replace_label`."""
+    label_map = {}
+    for old, new in zip(old_labels, new_labels):
+        label_map.setdefault(old, new)
+    for x in tensors:
+        x.replace_label(label_map)
+
+
+def _site_data(tensor, labels):
+    """Return the data of `tensor` with axes ordered as `labels`, typically
+    the physical, left and right labels of the network it belongs to."""
+    tensor_labels = tensor.labels
+    return np.transpose(tensor.data, [tensor_labels.index(x) for x in labels])
+
+
 def contract_multi_index_tensor_with_one_dim_array(tensor, array, label1,
                                                    label2):
     """Will contract a one dimensional tensor array of length N 
@@ -1412,9 +1476,10 @@ def contract_virtual_indices(array_1d, start=0, end=None,
     periodic_boundaries : bool
         If `True` leftmost and rightmost virtual indices are contracted.
     """
+    left_label, right_label = array_1d.left_label, array_1d.right_label
     C = array_1d[start].copy()
     for x in array_1d[start + 1:end]:
-        C = tsr.contract(C, x, array_1d.right_label, array_1d.left_label)
+        C = tsr.contract(C, x, right_label, left_label)
     if periodic_boundaries:
         # Contract left and right boundary indices (periodic boundaries)
         # Note that this will simply remove boundary indices of dimension one.
@@ -1483,8 +1548,11 @@ def mps_complex_conjugate(mps):
     """Will take complex conjugate of every entry of every tensor in mps, 
     and append label_suffix to every label"""
     new_mps = mps.copy()
+    # The data of new_mps is a fresh copy, so can be conjugated in place.
+    # Real tensors are their own complex conjugate.
     for x in new_mps.data:
-        x.conjugate()
+        if np.iscomplexobj(x.data):
+            np.conjugate(x.data, out=x.data)
     return new_mps
 
 
@@ -1675,8 +1743,32 @@ def inner_product_mps(mps_bra, mps_ket, complex_conjugate_bra=True,
         mps_ket_tmp = canonical_to_left_canonical(mps_ket)
     else:
         mps_ket_tmp = mps_ket
-    t = ladder_contract(mps_bra_tmp, mps_ket_tmp, mps_bra.phys_label,
-                        mps_ket.phys_label, complex_conjugate_array1=complex_conjugate_bra)
+    N = len(mps_ket_tmp)
+    if (len(mps_bra_tmp) == N and mps_bra_tmp.leftdim(0) == 1
+            and mps_ket_tmp.leftdim(0) == 1 and mps_bra_tmp.rightdim(N - 1) == 1
+            and mps_ket_tmp.rightdim(N - 1) == 1):
+        # Zip up the two MPS from the left, keeping only the boundary
+        # contraction, with bra index first, between sites
+        bra_labels = [mps_bra_tmp.phys_label, mps_bra_tmp.left_label,
+                      mps_bra_tmp.right_label]
+        ket_labels = [mps_ket_tmp.phys_label, mps_ket_tmp.left_label,
+                      mps_ket_tmp.right_label]
+        boundary = np.ones((1, 1))
+        for i in range(N):
+            bra = _site_data(mps_bra_tmp[i], bra_labels)
+            if complex_conjugate_bra and np.iscomplexobj(bra):
+                bra = np.conjugate(bra)
+            boundary = np.tensordot(bra, np.matmul(boundary,
+                                    _site_data(mps_ket_tmp[i], ket_labels)),
+                                    ([0, 1], [0, 1]))
+        # Store a numpy scalar rather than a 0-d array, as ladder_contract
+        # does
+        t = tsr.Tensor(boundary[0, 0])
+        t.data = boundary[0, 0]
+    else:
+        t = ladder_contract(mps_bra_tmp, mps_ket_tmp, mps_bra.phys_label,
+                            mps_ket.phys_label,
+                            complex_conjugate_array1=complex_conjugate_bra)
     if return_whole_tensor:
         return t
     else:
@@ -1697,12 +1789,36 @@ def contract_mps_mpo(mps, mpo):
         raise NotImplementedError(("Function not implemented for"
                                    + "MatrixProductStateCanonical"))
     N = len(mps)
+    mps_labels = [mps.phys_label, mps.left_label, mps.right_label]
+    mpo_labels = [mpo.physout_label, mpo.physin_label, mps.left_label,
+                  mps.right_label]
+    new_labels = [mpo.physout_label, mps.left_label, mps.right_label]
     new_mps = []
-    for i in range(N):
-        new_tensor = tsr.contract(mps[i], mpo[i], mps.phys_label,
-                                  mpo.physin_label)
-        new_tensor.consolidate_indices()
-        new_mps.append(new_tensor)
+    # The tensordot path needs exactly these indices on every tensor
+    mps_label_set = set(mps_labels)
+    mpo_label_set = set(mpo_labels)
+    if (mpo.left_label == mps.left_label and mpo.right_label == mps.right_label
+            and len(set(new_labels)) == 3
+            and all(len(x.labels) == 3 and set(x.labels) == mps_label_set
+                    for x in mps)
+            and all(len(x.labels) == 4 and set(x.labels) == mpo_label_set
+                    for x in mpo)):
+        for i in range(N):
+            # Contract the physical index, then combine the left (and right)
+            # indices of the MPS and MPO, with the MPS index varying slowest
+            C = np.tensordot(_site_data(mps[i], mps_labels),
+                             _site_data(mpo[i], mpo_labels), ([0], [1]))
+            d, l1, l2, r1, r2 = (C.shape[2], C.shape[0], C.shape[3],
+                                 C.shape[1], C.shape[4])
+            C = np.reshape(np.transpose(C, (2, 0, 3, 1, 4)),
+                           (d, l1 * l2, r1 * r2))
+            new_mps.append(tsr.Tensor(C, new_labels))
+    else:
+        for i in range(N):
+            new_tensor = tsr.contract(mps[i], mpo[i], mps.phys_label,
+                                      mpo.physin_label)
+            new_tensor.consolidate_indices()
+            new_mps.append(new_tensor)
     new_mps = MatrixProductState(new_mps, mps.left_label, mps.right_label,
                                  mpo.physout_label)
     return new_mps
@@ -1853,8 +1969,8 @@ def right_canonical_to_canonical(mps, threshold=1e-14):
                                                   threshold]
         S.data = np.diag(singular_values_to_keep)
         # Truncate corresponding singular index of U and V
-        U.data = U.data[:, :, 0:len(singular_values_to_keep)]
-        V.data = V.data[0:len(singular_values_to_keep)]
+        U.data = U.data[:, :, :len(singular_values_to_keep)]
+        V.data = V.data[:len(singular_values_to_keep)]
 
         U.replace_label(svd_label + "in", mps.right_label)
         V.replace_label(svd_label + "out", mps.left_label)
@@ -1870,13 +1986,13 @@ def right_canonical_to_canonical(mps, threshold=1e-14):
             # S is the norm of the state.
             tensors.append(S)
         else:
-            V = S[mps.right_label,] * V[mps.left_label,]
+            # Absorb S into V. As S is diagonal this is a scaling of the rows
+            # of V rather than a full contraction.
+            V.data = singular_values_to_keep[:, None] * V.data
             B = V[mps.right_label,] * mps[i + 1][mps.left_label,]
             # Store S and S^{-1} for next iteration
             S_prev = S.copy()
-            S_prev_inv = S_prev.copy()
-            S_prev_inv.inv()
-            # S_prev_inv.data = np.diag(1./singular_values_to_keep)
+            S_prev_inv = _inverse_singular_values(S_prev)
 
     # Construct MPS in canonical form
     return MatrixProductStateCanonical(tensors,
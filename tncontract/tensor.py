@@ -9,9 +9,20 @@ import copy
 import warnings
 import numpy as np
 import scipy as sp
+import scipy.linalg
+import scipy.linalg.lapack
 
 from tncontract import label as lbl
 
+try:
+    import cupy
+except ImportError:
+    cupy = None
+
+# Matrices held on the GPU with fewer elements than this are decomposed on the
+# host, where the decompositions are usually faster for small matrices
+gpu_decomposition_min_size = 10**6
+
 
 class Tensor():
     """
@@ -47,7 +58,7 @@ class Tensor():
 
     def __init__(self, data, labels=None, base_label="i"):
         labels = [] if labels is None else labels
-        self.data = np.array(data)
+        self.data = _array_module(data).array(data)
 
         if len(labels) == 0:
             self.assign_labels(base_label=base_label)
@@ -161,13 +172,18 @@ class Tensor():
         be assigned the label `base_label`+"i-1"."""
         self.labels = [base_label + str(i) for i in range(len(self.data.shape))]
 
-    def replace_label(self, old_labels, new_labels):
+    def replace_label(self, old_labels, new_labels=None):
         """
         Takes two lists old_labels, new_labels as arguments. If a label in 
         self.labels is in old_labels, it is replaced with the respective label 
-        In new_labels.
+        In new_labels. Alternatively, `old_labels` can be a dict mapping old
+        labels to new labels, in which case `new_labels` is not used.
         """
 
+        if isinstance(old_labels, dict):
+            self.labels = [old_labels.get(x, x) for x in self.labels]
+            return
+
         # If either argument is not a list, convert to list with single entry
         if not isinstance(old_labels, list):
             old_labels = [old_labels]
@@ -911,22 +927,7 @@ def tensor_svd(tensor, row_labels, svd_label="svd_",
     data_matrix = np.reshape(t.data, (total_input_dimension,
                                       total_output_dimension))
 
-    try:
-        u, s, v = np.linalg.svd(data_matrix, full_matrices=False)
-    except (np.linalg.LinAlgError, ValueError):
-        # Try with different lapack driver
-        warnings.warn(('numpy.linalg.svd failed, trying scipy.linalg.svd with' +
-                       ' lapack_driver="gesvd"'))
-        try:
-            u, s, v = sp.linalg.svd(data_matrix, full_matrices=False,
-                                    lapack_driver='gesvd')
-        except ValueError:
-            # Check for inf's and nan's:
-            print("tensor_svd failed. Matrix contains inf's: "
-                  + str(np.isinf(data_matrix).any())
-                  + ". Matrix contains nan's: "
-                  + str(np.isnan(data_matrix).any()))
-            raise  # re-raise the exception
+    u, s, v = _svd(data_matrix)
 
     # New shape original index labels as well as svd index
     U_shape = list(old_shape[0:len(row_labels)])
@@ -959,6 +960,77 @@ def tensor_svd(tensor, row_labels, svd_label="svd_",
         return U, S, V
 
 
+def _array_module(data):
+    """Return `cupy` if `data` is a `cupy.ndarray`, otherwise `numpy`."""
+    if cupy is not None and isinstance(data, cupy.ndarray):
+        return cupy
+    return np
+
+
+# The lapack gesdd routine and its optimal workspace size, keyed by the data
+# type and shape of the matrix
+_gesdd_cache = {}
+
+
+def _gesdd(a):
+    """Return the lapack gesdd routine for the 2D array `a` together with the
+    optimal workspace size for a reduced SVD of `a`. Both are looked up once
+    for every data type and shape, then reused."""
+    key = (a.dtype.char,) + a.shape
+    try:
+        return _gesdd_cache[key]
+    except KeyError:
+        if len(_gesdd_cache) > 1024:
+            _gesdd_cache.clear()
+        gesdd, gesdd_lwork = sp.linalg.lapack.get_lapack_funcs(
+            ('gesdd', 'gesdd_lwork'), (a,))
+        work, info = gesdd_lwork(a.shape[0], a.shape[1], compute_uv=1,
+                                 full_matrices=0)
+        # Lapack returns the workspace size as a float (possibly complex)
+        _gesdd_cache[key] = gesdd, max(int(np.ceil(np.real(work))), 1)
+        return _gesdd_cache[key]
+
+
+def _svd(data_matrix):
+    """
+    Return the reduced singular value decomposition `u, s, v` of the 2D array
+    `data_matrix`, with the singular values `s` as a one-dimensional array in
+    descending order. Falls back to the "gesvd" lapack driver if the default
+    one fails. Large `cupy` arrays are decomposed on the GPU.
+    """
+    if _array_module(data_matrix) is not np:
+        if data_matrix.size >= gpu_decomposition_min_size:
+            return cupy.linalg.svd(data_matrix, full_matrices=False)
+        return tuple(cupy.asarray(x) for x in _svd(data_matrix.get()))
+
+    # Lapack works on column-major arrays. If a column-major copy has to be
+    # made anyway, lapack may overwrite it rather than copy it again.
+    a = np.asfortranarray(data_matrix)
+    try:
+        gesdd, lwork = _gesdd(a)
+        u, s, v, info = gesdd(a, compute_uv=1, full_matrices=0, lwork=lwork,
+                              overwrite_a=not np.may_share_memory(a, data_matrix))
+        if info > 0:
+            raise np.linalg.LinAlgError("SVD did not converge")
+        if info < 0:
+            raise ValueError("illegal value in argument %d of gesdd" % -info)
+        return u, s, v
+    except (np.linalg.LinAlgError, ValueError):
+        # Try with different lapack driver
+        warnings.warn(('lapack gesdd failed, trying scipy.linalg.svd with' +
+                       ' lapack_driver="gesvd"'))
+        try:
+            return sp.linalg.svd(data_matrix, full_matrices=False,
+                                 lapack_driver='gesvd')
+        except ValueError:
+            # Check for inf's and nan's:
+            print("tensor_svd failed. Matrix contains inf's: "
+                  + str(np.isinf(data_matrix).any())
+                  + ". Matrix contains nan's: "
+                  + str(np.isnan(data_matrix).any()))
+            raise  # re-raise the exception
+
+
 def tensor_qr(tensor, row_labels, qr_label="qr_"):
     """
     Compute the QR decomposition of `tensor` after reshaping it into a matrix.
@@ -1041,7 +1113,7 @@ def tensor_qr(tensor, row_labels, qr_label="qr_"):
     data_matrix = np.reshape(t.data, (row_dimension,
                                       total_output_dimension))
 
-    q, r = np.linalg.qr(data_matrix, mode="reduced")
+    q, r = _qr(data_matrix)
 
     # New shape original index labels as well as svd index
     Q_shape = list(old_shape[0:len(row_labels)])
@@ -1055,6 +1127,22 @@ def tensor_qr(tensor, row_labels, qr_label="qr_"):
     return Q, R
 
 
+def _qr(data_matrix):
+    """
+    Return the reduced QR decomposition `q, r` of the 2D array `data_matrix`.
+    Large `cupy` arrays are decomposed on the GPU.
+    """
+    if _array_module(data_matrix) is not np:
+        if data_matrix.size >= gpu_decomposition_min_size:
+            return cupy.linalg.qr(data_matrix, mode='reduced')
+        return tuple(cupy.asarray(x) for x in _qr(data_matrix.get()))
+
+    # As in _svd, pass lapack a column-major array it is free to overwrite
+    a = np.asfortranarray(data_matrix)
+    return sp.linalg.qr(a, mode='economic', check_finite=False,
+                        overwrite_a=not np.may_share_memory(a, data_matrix))
+
+
 def tensor_lq(tensor, row_labels, lq_label="lq_"):
     """
     Compute the LQ decomposition of `tensor` after reshaping it into a matrix.
@@ -1157,29 +1245,35 @@ def truncated_svd(tensor, row_labels, chi=0, threshold=1e-15,
 
     S.data = np.diag(singular_values_to_keep)
 
-    U.move_index("svd_in", 0)
-    U.data = U.data[0:len(singular_values_to_keep)]
-    U.move_index("svd_in", (np.size(U.labels) - 1))
-    V.data = V.data[0:len(singular_values_to_keep)]
+    # The singular index is the last index of U and the first of V, so
+    # truncation is a slice (and a view) of each
+    U.data = U.data[..., :len(singular_values_to_keep)]
+    V.data = V.data[:len(singular_values_to_keep)]
 
 
     if absorb_singular_values is None:
         return U, S, V
     # Absorb singular values S into either V or U
-    # or take the square root of S and absorb into both (default)
+    # or take the square root of S and absorb into both (default).
+    # As S is diagonal this is a scaling of the last index of U or the first
+    # index of V rather than a full contraction, and leaves the labels of U
+    # and V unchanged.
     if absorb_singular_values == "left":
-        U_new = contract(U, S, ["svd_in"], ["svd_out"])
-        V_new = V
+        U.data = U.data * singular_values_to_keep
     elif absorb_singular_values == "right":
-        V_new = contract(S, V, ["svd_in"], ["svd_out"])
-        U_new = U
+        V.data = _scale_rows(V.data, singular_values_to_keep)
     else:
-        sqrtS = S.copy()
-        sqrtS.data = np.sqrt(sqrtS.data)
-        U_new = contract(U, sqrtS, ["svd_in"], ["svd_out"])
-        V_new = contract(sqrtS, V, ["svd_in"], ["svd_out"])
+        sqrt_singular_values = np.sqrt(singular_values_to_keep)
+        U.data = U.data * sqrt_singular_values
+        V.data = _scale_rows(V.data, sqrt_singular_values)
+
+    return U, V, truncated_evals
+
 
-    return U_new, V_new, truncated_evals
+def _scale_rows(data, scale):
+    """Return `data` with its first index scaled by the one-dimensional array
+    `scale`."""
+    return np.reshape(scale, (-1,) + (1,) * (data.ndim - 1)) * data
 
 
 def conjugate(tensor):
@@ -0,0 +1,153 @@
+from __future__ import (absolute_import, division,
+                        print_function, unicode_literals)
+from builtins import *
+
+
+"""
+test_onedim_core
+==========
+
+Unit tests for canonisation and contraction of one-dimensional networks
+"""
+
+import numpy as np
+import numpy.testing as testing
+import pytest
+import tncontract as tnc
+
+
+def test_left_canonise_without_truncation():
+    np.random.seed(0)
+    psi = tnc.onedim.init_mps_random(8, 2, 6)
+    norm = psi.norm()
+    psi.left_canonise(threshold=0)
+    l, r = psi.check_canonical_form(threshold=1e-10, print_output=False)
+    testing.assert_equal(l, len(psi) - 1)
+    testing.assert_almost_equal(psi.norm(), norm, decimal=10)
+    psi.right_canonise(threshold=0, normalise=True)
+    l, r = psi.check_canonical_form(threshold=1e-10, print_output=False)
+    testing.assert_equal(r, 0)
+    testing.assert_almost_equal(psi.norm(), 1.0, decimal=10)
+
+
+def test_canonise_empty_segment_does_nothing():
+    np.random.seed(5)
+    psi = tnc.onedim.init_mps_random(5, 2, 3)
+    data = [t.data.copy() for t in psi]
+    psi.left_canonise(len(psi), len(psi))
+    psi.right_canonise(0, 0)
+    for t, x in zip(psi, data):
+        testing.assert_equal(t.data, x)
+
+
+def test_variational_compress_improves_on_svd_compress():
+    np.random.seed(1)
+    psi = tnc.onedim.init_mps_random(8, 2, 6)
+    psi_svd = psi.copy()
+    psi_svd.svd_compress(chi=3)
+    psi_var = psi.variational_compress(3, max_iter=50, tolerance=1e-8)
+    testing.assert_equal(max(psi_var.bonddims()), 3)
+    d_svd = tnc.onedim.frob_distance_squared(psi, psi_svd)
+    d_var = tnc.onedim.frob_distance_squared(psi, psi_var)
+    testing.assert_array_less(d_var, d_svd * (1 + 1e-8))
+
+
+def test_inner_product_mps_matches_dense_vectors():
+    np.random.seed(2)
+    psi = tnc.onedim.init_mps_random(6, 2, 4)
+    phi = tnc.onedim.init_mps_random(6, 2, 3)
+    for t in phi:
+        t.data = t.data + 1j * np.random.rand(*t.data.shape)
+    psi_vec = tnc.onedim.contract_virtual_indices(psi).data
+    phi_vec = tnc.onedim.contract_virtual_indices(phi).data
+    testing.assert_almost_equal(tnc.onedim.inner_product_mps(phi, psi),
+                                np.vdot(phi_vec, psi_vec), decimal=10)
+    testing.assert_almost_equal(
+        tnc.onedim.inner_product_mps(phi, psi, complex_conjugate_bra=False),
+        np.sum(phi_vec * psi_vec), decimal=10)
+    assert isinstance(tnc.onedim.inner_product_mps(psi, psi), np.float64)
+
+
+def test_mps_tensors_stored_phys_left_right():
+    np.random.seed(3)
+    tensors = [tnc.random_tensor(3, 2, 1, labels=["right", "phys", "left"])]
+    tensors += [tnc.random_tensor(3, 2, 3, labels=["left", "phys", "right"])]
+    tensors += [tnc.random_tensor(2, 3, labels=["phys", "left"])]
+    psi = tnc.onedim.MatrixProductState(tensors)
+    for chi in [None, 2]:
+        psi.left_canonise(chi=chi)
+        for t in psi:
+            testing.assert_equal(t.labels, ["phys", "left", "right"])
+    psi = tnc.onedim.init_mps_random(5, 2, 4)
+    psi.right_canonise(chi=3)
+    for t in psi:
+        testing.assert_equal(t.labels, ["phys", "left", "right"])
+    psi.svd_compress(chi=2)
+    for t in psi:
+        testing.assert_equal(t.labels, ["phys", "left", "right"])
+
+
+def test_contract_mps_mpo_matches_dense_operator():
+    np.random.seed(4)
+    psi = tnc.onedim.init_mps_random(4, 2, 3)
+    mpo = tnc.onedim.onebody_sum_mpo([tnc.matrices.sigmaz()] * 4)
+    psi_vec = tnc.onedim.contract_virtual_indices(psi).data.flatten()
+    z = np.array([1, -1])
+    sigmaz_sum = sum(np.kron(np.kron(np.ones(2 ** k), z), np.ones(2 ** (3 - k)))
+                     for k in range(4))
+    result = tnc.onedim.contract_mps_mpo(psi, mpo)
+    testing.assert_almost_equal(
+        tnc.onedim.contract_virtual_indices(result).data.flatten(),
+        sigmaz_sum * psi_vec, decimal=10)
+
+
+def test_contract_mps_mpo_with_extra_index():
+    np.random.seed(7)
+    psi = tnc.onedim.init_mps_random(4, 2, 3)
+    mpo = tnc.onedim.onebody_sum_mpo([tnc.matrices.sigmaz()] * 4)
+    expected = tnc.onedim.contract_mps_mpo(psi, mpo)
+    # A site with an extra (dummy) index is contracted by the general path
+    psi[1].add_dummy_index("aux")
+    result = tnc.onedim.contract_mps_mpo(psi, mpo)
+    assert "aux" in result[1].labels
+    result[1].remove_all_dummy_indices(["aux"])
+    testing.assert_almost_equal(
+        tnc.onedim.contract_virtual_indices(result).data,
+        tnc.onedim.contract_virtual_indices(expected).data, decimal=10)
+
+
+def test_canonise_and_variational_compress_on_gpu():
+    cupy = pytest.importorskip("cupy")
+    np.random.seed(6)
+    psi = tnc.onedim.init_mps_random(8, 2, 6)
+    psi_gpu = psi.copy()
+    for t in psi_gpu:
+        t.data = cupy.asarray(t.data)
+    min_size = tnc.tensor.gpu_decomposition_min_size
+    try:
+        # Decompose on the host and on the GPU
+        for size in [min_size, 0]:
+            tnc.tensor.gpu_decomposition_min_size = size
+            for kwargs in [{}, {"chi": 3}, {"threshold": 0}]:
+                phi = psi_gpu.copy()
+                phi.left_canonise(**kwargs)
+                assert all(isinstance(t.data, cupy.ndarray) for t in phi)
+                expected = psi.copy()
+                expected.left_canonise(**kwargs)
+                for t in phi:
+                    t.data = cupy.asnumpy(t.data)
+                testing.assert_almost_equal(
+                    abs(tnc.onedim.inner_product_mps(phi, expected)),
+                    expected.norm() ** 2, decimal=8)
+            phi = psi_gpu.variational_compress(3, max_iter=50,
+                                               tolerance=1e-8)
+            assert all(isinstance(t.data, cupy.ndarray) for t in phi)
+            for t in phi:
+                t.data = cupy.asnumpy(t.data)
+            expected = psi.variational_compress(3, max_iter=50,
+                                                tolerance=1e-8)
+            testing.assert_almost_equal(
+                tnc.onedim.frob_distance_squared(psi, phi),
+                tnc.onedim.frob_distance_squared(psi, expected), decimal=8)
+    finally:
+        tnc.tensor.gpu_decomposition_min_size = min_size